@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import asyncio
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -16,6 +17,9 @@ mcp = FastMCP(
 caledar_module = CalendarModule()
 
 class CalendarEvent(BaseModel):
+    # 요청마다 읽기만 하는 DTO이므로 불변으로 두고 정의되지 않은 필드는 무시
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     title: str
     start_date: str        
     end_date: str
@@ -23,9 +27,7 @@ class CalendarEvent(BaseModel):
     notes: Optional[str] = None
     calendar_name: Optional[str] = None
 
-@mcp.tool()
-async def create_event(event: CalendarEvent) -> str:
-    """캘린더 생성"""
+async def _create_calendar_event(event: CalendarEvent) -> Dict[str, Any]:
     return await caledar_module.create_event(
         title=event.title,
         start_date=event.start_date,
@@ -35,5 +37,16 @@ async def create_event(event: CalendarEvent) -> str:
         calendar_name=event.calendar_name
     )
 
+@mcp.tool()
+async def create_event(event: CalendarEvent) -> str:
+    """캘린더 생성"""
+    return await _create_calendar_event(event)
+
+@mcp.tool()
+async def create_events(events: List[CalendarEvent]) -> List[Dict[str, Any]]:
+    """캘린더 여러 개를 한 번의 요청으로 생성"""
+    # 일정끼리는 서로 독립적이므로 AppleScript 호출을 동시에 진행
+    return await asyncio.gather(*(_create_calendar_event(event) for event in events))
+
 if __name__ == "__main__":
     mcp.run()
\ No newline at end of file
@@ -1,79 +1,98 @@
 from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 import asyncio
 import anyio
-from contextlib import asynccontextmanager
 import os
 import json
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from dotenv import load_dotenv
-import subprocess
+from pathlib import Path
 import time
+import random
+from functools import lru_cache
+
+# uvloop이 설치되어 있으면 기본 이벤트 루프 대신 사용
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 # .env 파일 로드
 load_dotenv()
 
-# pytz 설치 필요: pip install pytz
-
 # Gemini API 설정
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 if not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY가 .env 파일에 설정되어 있지 않습니다.")
 
+# 모델은 프로세스 당 한 번만 생성해서 재사용
+genai.configure(api_key=GEMINI_API_KEY)
+GEMINI_MODEL = genai.GenerativeModel('gemini-2.5-flash-preview-04-17')
+
+# 요청 한도 초과(429) 시 재시도 횟수
+GEMINI_MAX_RETRIES = 3
+
 server_params = StdioServerParameters(
     command="python",
     args=["apple_mcp.py"],
 )
 
 # 한국 시간대 설정
-korea_tz = pytz.timezone('Asia/Seoul')
-today = datetime.now(korea_tz)
-one_week_ago = today - timedelta(days=7)
-
-# 일주일 동안의 모든 날짜 생성
-dates = [(one_week_ago + timedelta(days=x)) for x in range(8)]  # 8일 = 일주일 전부터 오늘까지
-date_paths = []
-
-# Jira, Slack, Diary 경로 생성
-for date in dates:
-    date_str = date.strftime("%Y-%m-%d")
-    date_paths.extend([
-        f"/Users/sondonghup/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report/Jira/{date_str}",
-        f"/Users/sondonghup/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report/Slack/{date_str}",
-        f"/Users/sondonghup/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report/Diary/{date_str}",
-        f"/Users/sondonghyeob/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report/Gmail/{date_str}"
-    ])
-
-# 실제 존재하는 디렉토리만 필터링
-existing_paths = []
-for path in date_paths:
-    if os.path.exists(path):
-        existing_paths.append(path)
-
-# Dailyplan 디렉토리 경로
-dailyplan_path = "/Users/sondonghup/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report/Dailyplan"
-if os.path.exists(dailyplan_path):
-    existing_paths.append(dailyplan_path)
-
-# 최소한 하나의 허용 디렉토리가 필요하므로, 존재하는 디렉토리가 없으면 기본 디렉토리 추가
-if not existing_paths:
-    base_path = "/Users/sondonghup/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report"
-    if os.path.exists(base_path):
-        existing_paths.append(base_path)
-    else:
-        existing_paths.append(".")  # 현재 디렉토리를 기본으로 사용
-
-file_server_params = StdioServerParameters(
-    command="npx",
-    args=[
-        "-y",
-        "@modelcontextprotocol/server-filesystem",
-        existing_paths[0],  # 첫 번째 디렉토리를 허용 디렉토리로 지정
-        *existing_paths[1:]  # 나머지 디렉토리들을 추가 디렉토리로 지정
-    ]
-)
+KST = ZoneInfo('Asia/Seoul')
+
+DAILY_REPORT_PATH = "/Users/sondonghup/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report"
+
+# 날짜별 폴더를 가지는 Jira, Slack, Diary, Gmail 경로
+SOURCE_PATHS = [
+    f"{DAILY_REPORT_PATH}/Jira",
+    f"{DAILY_REPORT_PATH}/Slack",
+    f"{DAILY_REPORT_PATH}/Diary",
+    "/Users/sondonghyeob/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report/Gmail"
+]
+
+def list_subdirectory_names(path):
+    """path 바로 아래 디렉토리 이름 집합 (path가 없으면 빈 집합)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+def find_note_directories(today):
+    """today 기준 일주일 동안의 노트가 있는 디렉토리 목록"""
+    one_week_ago = today - timedelta(days=7)
+
+    # 일주일 동안의 모든 날짜 문자열 생성 (8일 = 일주일 전부터 오늘까지)
+    date_strs = [(one_week_ago + timedelta(days=x)).strftime("%Y-%m-%d") for x in range(8)]
+
+    # 날짜마다 stat 하지 않고 경로별로 한 번만 목록을 읽어 존재하는 날짜 폴더만 추리기
+    source_dirs = {source: list_subdirectory_names(source) for source in SOURCE_PATHS}
+
+    existing_paths = [f"{source}/{date_str}"
+                      for date_str in date_strs
+                      for source in SOURCE_PATHS
+                      if date_str in source_dirs[source]]
+
+    # Dailyplan 디렉토리 경로
+    dailyplan_path = f"{DAILY_REPORT_PATH}/Dailyplan"
+    if os.path.exists(dailyplan_path):
+        existing_paths.append(dailyplan_path)
+
+    # 존재하는 디렉토리가 없으면 기본 디렉토리 사용
+    if not existing_paths and os.path.exists(DAILY_REPORT_PATH):
+        existing_paths.append(DAILY_REPORT_PATH)
+
+    return existing_paths
+
+# 읽어올 노트 확장자 (str.endswith에 튜플로 전달)
+NOTE_EXTENSIONS = ('.md',)
+
+# 동시에 읽을 노트 파일 수
+READ_CONCURRENCY = 16
 
 CONFIG = {
     'response_mime_type': 'application/json',
@@ -112,15 +131,19 @@ CONFIG = {
     }
 }
 
-# 내일 날짜 계산
-korea_tz = pytz.timezone('Asia/Seoul')
-tomorrow = datetime.now(korea_tz) + timedelta(days=1)
-tomorrow_str = tomorrow.strftime("%Y년 %m월 %d일")
-tomorrow_weekday = tomorrow.strftime("%A")  # 요일 추가
+@lru_cache(maxsize=1)
+def get_generation_config():
+    """CONFIG를 GenerationConfig 객체로 한 번만 변환"""
+    return genai.types.GenerationConfig(**CONFIG)
 
-# 오늘 날짜는 {datetime.now(korea_tz)} 입니다.
+def build_prompt(today):
+    """today 기준으로 내일 일정을 정리하는 프롬프트 생성"""
+    # 내일 날짜 계산
+    tomorrow = today + timedelta(days=1)
+    tomorrow_str = tomorrow.strftime("%Y년 %m월 %d일")
+    tomorrow_weekday = tomorrow.strftime("%A")  # 요일 추가
 
-PROMPT = f"""
+    return f"""
 오늘 날짜는 {today} 입니다.
 {tomorrow_str}({tomorrow_weekday})날 알어나거나 해야하는 일만 정리해주세요
 다른 날짜의 일은 전부 제거해주세요
@@ -151,168 +174,301 @@ OBSIDIAN_VAULT_PATH = os.getenv("OBSIDIAN_VAULT_PATH")
 SLACK_BASE_FOLDER = os.getenv("SLACK_BASE_FOLDER", "Slack")
 JIRA_BASE_FOLDER = os.getenv("JIRA_BASE_FOLDER", "Jira")
 
-def open_obsidian_note(file_path):
+async def open_obsidian_note(file_path):
     """Obsidian 노트 열기"""
     try:
-        subprocess.run(["open", file_path])
+        process = await asyncio.create_subprocess_exec("open", file_path)
+        await process.wait()
     except Exception as e:
         print(f"파일 열기 실패: {e}")
 
-@asynccontextmanager
-async def create_server_session(params):
-    async with stdio_client(params) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            yield session
+# 요청을 보내기 전에 세션 스트림이 이미 닫혀 있을 때만 발생하는 오류
+# (서버에 요청이 전달되지 않았으므로 다시 연결해 재시도해도 이벤트가 중복 생성되지 않음)
+MCP_SEND_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+)
+
+# ping 등 일반 요청의 응답 대기 시간
+MCP_REQUEST_TIMEOUT = timedelta(seconds=30)
+
+# 이벤트 생성 도구의 응답 대기 시간 (AppleScript로 여러 일정을 만들므로 길게)
+MCP_TOOL_TIMEOUT = timedelta(minutes=5)
+
+class PersistentMCP:
+    """MCP 서버 프로세스와 세션을 한 번만 띄워 재사용
+
+    stdio 세션은 연 태스크에서 닫아야 하므로 전용 태스크(_serve)가 세션을 열고 닫고,
+    다른 태스크는 그 세션으로 요청만 보냅니다. 그래서 어느 태스크에서든 start/restart를 호출할 수 있습니다.
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self.session = None
+        self._task = None
+        self._closing = None
+        self._lock = asyncio.Lock()
+
+    async def _serve(self, ready):
+        try:
+            async with stdio_client(self.params) as (read, write):
+                async with ClientSession(read, write, read_timeout_seconds=MCP_REQUEST_TIMEOUT) as session:
+                    await session.initialize()
+                    self.session = session
+                    ready.set_result(session)
+                    # aclose가 호출될 때까지 세션 유지
+                    await self._closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                print(f"iMCP 세션 종료 중 에러 발생: {e}")
+        finally:
+            self.session = None
+
+    async def start(self):
+        async with self._lock:
+            # 이미 연결되어 있으면 기존 세션 재사용
+            if self.session is not None:
+                return self.session
+
+            ready = asyncio.get_running_loop().create_future()
+            self._closing = asyncio.Event()
+            self._task = asyncio.create_task(self._serve(ready))
+            try:
+                return await ready
+            except BaseException:
+                await self._stop()
+                raise
+
+    async def restart(self):
+        """끊긴 세션을 닫고 서버 프로세스와 세션을 다시 띄우기"""
+        await self.aclose()
+        return await self.start()
+
+    async def ensure_alive(self):
+        """세션이 응답하는지 ping으로 확인하고, 응답이 없으면 다시 연결"""
+        session = await self.start()
+        try:
+            await session.send_ping()
+            return session
+        except Exception as e:
+            print(f"iMCP 세션이 응답하지 않아 다시 연결합니다: {type(e).__name__}: {e}")
+            return await self.restart()
+
+    async def list_tools(self):
+        session = await self.start()
+        return await session.list_tools()
+
+    async def call_tool(self, name, arguments=None, read_timeout_seconds=None):
+        session = await self.start()
+        return await session.call_tool(name, arguments, read_timeout_seconds=read_timeout_seconds)
+
+    async def _stop(self):
+        task, self._task = self._task, None
+        self.session = None
+        if task is None:
+            return
+        self._closing.set()
+        await task
+
+    async def aclose(self):
+        async with self._lock:
+            await self._stop()
+
+def to_kst_iso(date_str, time_str):
+    """'YYYY-MM-DD', 'HH:MM' 문자열을 한국 시간 ISO 형식으로 변환 ('9:00'처럼 0이 빠진 시간도 허용)"""
+    return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M").replace(tzinfo=KST).isoformat(timespec='seconds')
+
+def schedule_to_event(schedule):
+    """Gemini가 만든 일정 하나를 create_events 이벤트 데이터로 변환"""
+    # 한국 시간 기준 ISO 형식으로 변환
+    start_iso = to_kst_iso(schedule['날짜'], schedule['시작시간'])
+    end_iso = to_kst_iso(schedule['날짜'], schedule['종료시간'])
+
+    print(f"시작 시간: {start_iso}")
+    print(f"종료 시간: {end_iso}")
+
+    event = {
+        "title": schedule['타이틀'],
+        "start_date": start_iso,
+        "end_date": end_iso,
+        "location": None,  # 선택적 필드
+        "notes": "\n".join(schedule['내용']).replace("[", " ").replace("]", " "  ),
+        "calendar_name": "스케쥴러"
+    }
+    # 값이 없는 선택적 필드는 보내지 않고 서버 기본값 사용
+    return {key: value for key, value in event.items() if value is not None}
+
+def list_note_files(directory):
+    """디렉토리 안의 노트 파일 이름 목록"""
+    with os.scandir(directory) as entries:
+        return sorted(entry.name for entry in entries
+                      if entry.is_file() and entry.name.endswith(NOTE_EXTENSIONS))
+
+def list_note_files_by_directory(directories):
+    """디렉토리마다 노트 파일 이름 목록 (directories 순서 유지)"""
+    return [list_note_files(directory) for directory in directories]
+
+async def read_note(file_path, semaphore):
+    """semaphore로 동시 읽기 수를 제한하면서 노트 내용 읽기"""
+    async with semaphore:
+        return await asyncio.to_thread(Path(file_path).read_text, encoding='utf-8')
 
 async def ask_gemini(question):
-    try:
-        # API 키 설정 (함수 외부에서 한 번만 실행하는 것이 좋음)
-        genai.configure(api_key=GEMINI_API_KEY)
-        
-        # 모델 생성
-        model = genai.GenerativeModel('gemini-2.5-flash-preview-04-17')
-        
-        # 콘텐츠 생성
-        response = model.generate_content(
-            contents=question,
-            generation_config=CONFIG  # CONFIG가 있다면
-        )
-        
-        return response.text
-        
-    except Exception as e:
-        print(f"Gemini API 오류: {e}")
-        return None
+    for attempt in range(GEMINI_MAX_RETRIES + 1):
+        try:
+            # 콘텐츠 생성 (동기 API이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+            response = await asyncio.to_thread(
+                GEMINI_MODEL.generate_content,
+                contents=question,
+                generation_config=get_generation_config()
+            )
+            
+            return response.text
 
-async def run():
-    try:
-        # Gemini API로 날씨 질문
+        except google_exceptions.ResourceExhausted as e:
+            if attempt == GEMINI_MAX_RETRIES:
+                print(f"Gemini API 오류: {e}")
+                return None
 
-        # File 서버 초기화 및 경로 설정
-        async with create_server_session(file_server_params) as file_session:
-            try:
-                print("File 서버 초기화 완료")
-                
-                tools_response = await file_session.list_tools()
-                tool_names = [tool.name for tool in tools_response.tools]
-                print("도구:", ", ".join(tool_names)) 
-
-                allowed_response = await file_session.call_tool("list_allowed_directories")
-                allowed_text = allowed_response.content[0].text
-                
-                directories = [line.strip() for line in allowed_text.split('\n') if line.strip()]
-                if not directories:
-                    directories = ['.']
-                    
-                print(f"디렉토리: {', '.join(directories)}")
+            # 요청 한도 초과는 지수 백오프 + 지터 후 재시도
+            delay = 2 ** attempt + random.random()
+            print(f"Gemini API 요청 한도 초과, {delay:.1f}초 후 다시 시도합니다.")
+            await asyncio.sleep(delay)
             
-                contents = ""
-
-                # 각 디렉토리에서 파일 읽기
-                for directory in directories:
-                    print(f"\n--- {directory} ---")
-                    
-                    dir_response = await file_session.call_tool("list_directory", {"path": directory})
-                    dir_text = dir_response.content[0].text
-                    
-                    # .md 파일만 필터링
-                    text_files = [line.replace('[FILE]', '').strip() for line in dir_text.split('\n') 
-                                if line.startswith('[FILE]') and line.endswith('.md')]
-                    
-                    print(f"{len(text_files)}개 파일: {', '.join(text_files)}")
-                    
-                    # 모든 .md 파일 읽기
-                    for filename in text_files:
-                        try:
-                            file_path = os.path.join(directory, filename)
-                            file_response = await file_session.call_tool("read_file", {"path": file_path})
-                            content = file_response.content[0].text
-                            contents += f"\n\n=== 아래는 날짜 : {filename.split('.')[0]} 일의 내용 입니다. ===\n\n"
-                            contents += content
-                            
-                            print(f"파일 읽기 성공: {filename}")
-                        except Exception as e:
-                            print(f"오류: {filename} 읽기 실패 - {str(e)}")
-                            print(f"에러 타입: {type(e).__name__}")
-                            import traceback
-                            print("상세 에러 스택:")
-                            print(traceback.format_exc())
-
-                gemini_response = await ask_gemini(PROMPT + "\n\n내용:" + contents)
-
-                print("\nGemini API 응답:")
-                print(f"***************** : {contents}")
-                print(gemini_response)
-                print("\n" + "="*50 + "\n")
-
-                                # iMCP 서버 초기화 및 이벤트 생성
-                async with create_server_session(server_params) as imcp_session:
-                    try:
+        except Exception as e:
+            print(f"Gemini API 오류: {e}")
+            return None
+
+class SchedulerService:
+    """iMCP 세션을 유지하면서 매일 일정을 생성하는 서비스
+
+    세션은 서비스에 들어갈 때 한 번 열고 나올 때 닫으므로
+    run_once를 여러 번 호출해도 서버 프로세스와 initialize는 한 번뿐입니다.
+    서버가 죽거나 연결이 끊기면 다음 요청에서 다시 연결합니다.
+    """
+
+    def __init__(self):
+        self.imcp = PersistentMCP(server_params)
+
+    async def __aenter__(self):
+        # 시작 시 연결에 실패해도 스케줄러는 계속 실행하고 run_once에서 다시 연결
+        try:
+            await self.imcp.start()
+        except Exception as e:
+            print(f"iMCP 서버 연결 실패, 다음 실행 때 다시 시도합니다: {e}")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.imcp.aclose()
+
+    async def create_events(self, events):
+        """이벤트 생성 요청
+
+        create_events는 같은 요청을 다시 보내면 일정이 중복 생성되므로,
+        보내기 전에 세션 상태를 확인하고 요청이 전달되지 않은 경우에만 재시도합니다.
+        """
+        await self.imcp.ensure_alive()
+        try:
+            return await self.imcp.call_tool("create_events", {"events": events}, MCP_TOOL_TIMEOUT)
+        except MCP_SEND_ERRORS as e:
+            print(f"iMCP 세션이 닫혀 있어 다시 연결합니다: {type(e).__name__}: {e}")
+            await self.imcp.restart()
+            return await self.imcp.call_tool("create_events", {"events": events}, MCP_TOOL_TIMEOUT)
+
+    async def run_once(self):
+        try:
+            # 실행할 때마다 오늘 날짜 기준으로 노트 디렉토리를 다시 찾기
+            today = datetime.now(KST)
+
+            # 노트는 로컬 파일이므로 MCP를 거치지 않고 직접 읽기
+            directories = await asyncio.to_thread(find_note_directories, today)
+            print(f"디렉토리: {', '.join(directories)}")
+
+            # scandir는 빠르므로 디렉토리마다 스레드를 넘기지 않고 한 번에 조회
+            listings = await asyncio.to_thread(list_note_files_by_directory, directories)
+
+            paths = []
+            for directory, text_files in zip(directories, listings):
+                print(f"\n--- {directory} ---")
+                print(f"{len(text_files)}개 파일: {', '.join(text_files)}")
+                paths.extend((filename, os.path.join(directory, filename)) for filename in text_files)
+
+            # 모든 .md 파일을 동시에 읽기 (최대 READ_CONCURRENCY개씩)
+            semaphore = asyncio.Semaphore(READ_CONCURRENCY)
+            file_contents = await asyncio.gather(
+                *(read_note(file_path, semaphore) for _, file_path in paths),
+                return_exceptions=True
+            )
+
+            # 프롬프트와 노트 내용을 한 리스트에 모아 한 번만 합치기
+            chunks = [build_prompt(today), "\n\n내용:"]
+            for (filename, _), content in zip(paths, file_contents):
+                if isinstance(content, BaseException):
+                    print(f"오류: {filename} 읽기 실패 - {str(content)}")
+                    print(f"에러 타입: {type(content).__name__}")
+                    continue
+
+                chunks.append(f"\n\n=== 아래는 날짜 : {filename.split('.')[0]} 일의 내용 입니다. ===\n\n")
+                chunks.append(content)
+            
+                print(f"파일 읽기 성공: {filename}")
 
-                        for schedule in gemini_response:
-                            print(f"일정: {schedule}")
-                            start_time = schedule['시작시간']
-                            end_time = schedule['종료시간']
-                            tasks = schedule['내용']
-                            title = schedule['타이틀']
-                            date = schedule['날짜']
-                                                        # ISO 형식으로 변환 (더 단순한 형식)
-                            start_iso = f"{date} {start_time}"
-                            end_iso = f"{date} {end_time}"
-
-                            start_iso = datetime.strptime(start_iso, "%Y-%m-%d %H:%M")
-                            end_iso = datetime.strptime(end_iso, "%Y-%m-%d %H:%M")
-
-                            korean_timezone = pytz.timezone('Asia/Seoul')
-
-                            start_iso = korean_timezone.localize(start_iso)
-                            end_iso = korean_timezone.localize(end_iso)
-
-                            start_iso = start_iso.isoformat()
-                            end_iso = end_iso.isoformat()
-
-                            print(f"시작 시간: {start_iso}")
-                            print(f"종료 시간: {end_iso}")
-
-                            # 이벤트 생성
-                            result = await imcp_session.call_tool(
-                                "create_event", 
-                                arguments:={
-                                    "event": {
-                                        "title": title,
-                                        "start_date": str(start_iso),
-                                        "end_date": str(end_iso),
-                                        "location": None,  # 선택적 필드
-                                        "notes": "\n".join(tasks).replace("[", " ").replace("]", " "  ),
-                                        "calendar_name": "스케쥴러"
-
-                                    }
-                                }
-                            )
-                            print(f"arguments : {arguments}")
-                            print(f"이벤트 생성 결과: {result}")
+            question = "".join(chunks)
 
+            gemini_response = await ask_gemini(question)
+
+            print("\nGemini API 응답:")
+            print(f"***************** : {question}")
+            print(gemini_response)
+            print("\n" + "="*50 + "\n")
+
+            # 응답은 JSON 문자열이므로 한 번만 파싱해서 일정 목록으로 사용
+            schedules = json.loads(gemini_response) if gemini_response else []
+
+            # 이벤트 생성 (서비스가 열어 둔 iMCP 세션 재사용)
+            try:
+
+                # 일정별 이벤트 데이터를 먼저 만든 뒤 한 번의 요청으로 전송
+                # (잘못된 일정은 건너뛰고 나머지는 그대로 생성)
+                events = []
+                for schedule in schedules:
+                    print(f"일정: {schedule}")
+                    try:
+                        events.append(schedule_to_event(schedule))
                     except Exception as e:
-                        print(f"iMCP 서버 작업 중 에러 발생: {str(e)}")
-                        print(f"에러 타입: {type(e).__name__}")
-                        import traceback
-                        print("상세 에러 스택:")
-                        print(traceback.format_exc())
+                        print(f"일정 변환 실패, 건너뜁니다: {schedule} - {type(e).__name__}: {e}")
+
+                if not events:
+                    print("생성할 이벤트가 없습니다.")
+                    return
+
+                # 이벤트 생성
+                result = await self.create_events(events)
+                print(f"이벤트 {len(events)}개 생성 결과: {result}")
 
             except Exception as e:
-                print(f"File 서버 작업 중 에러 발생: {str(e)}")
+                print(f"iMCP 서버 작업 중 에러 발생: {str(e)}")
                 print(f"에러 타입: {type(e).__name__}")
                 import traceback
                 print("상세 에러 스택:")
                 print(traceback.format_exc())
 
-    except Exception as e:
-        print(f"전체 작업 중 에러 발생: {str(e)}")
-        print(f"에러 타입: {type(e).__name__}")
-        import traceback
-        print("상세 에러 스택:")
-        print(traceback.format_exc())
+        except Exception as e:
+            print(f"전체 작업 중 에러 발생: {str(e)}")
+            print(f"에러 타입: {type(e).__name__}")
+            import traceback
+            print("상세 에러 스택:")
+            print(traceback.format_exc())
+
+async def run():
+    async with SchedulerService() as service:
+        await service.run_once()
 
 if __name__ == "__main__":
     asyncio.run(run())
\ No newline at end of file
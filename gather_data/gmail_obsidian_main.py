@@ -5,7 +5,8 @@ import email
 from email.header import decode_header
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
-import pytz
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
@@ -13,20 +14,26 @@ load_dotenv()
 OBSIDIAN_VAULT_PATH = os.getenv("OBSIDIAN_VAULT_PATH", "/Users/sondonghup/Library/Mobile Documents/iCloud~md~obsidian/Documents/daily report/")
 GMAIL_FOLDER = "Gmail"
 
+# 이메일 노트를 동시에 저장할 최대 스레드 수
+WRITE_WORKERS = 8
+
+def write_note(file_path, content):
+    """노트 내용을 한 번에 저장"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
 def save_emails_to_obsidian(emails):
     # Gmail 폴더 생성
     gmail_path = os.path.join(OBSIDIAN_VAULT_PATH, GMAIL_FOLDER)
     os.makedirs(gmail_path, exist_ok=True)
     
     # 이메일을 날짜별로 그룹화
-    emails_by_date = {}
+    emails_by_date = defaultdict(list)
     for email in emails:
-        date = email['date'].strftime('%Y-%m-%d')
-        if date not in emails_by_date:
-            emails_by_date[date] = []
-        emails_by_date[date].append(email)
+        emails_by_date[email['date'].strftime('%Y-%m-%d')].append(email)
     
-    # 각 날짜별로 파일 생성
+    # 각 날짜별로 저장할 파일 내용 준비
+    notes = []
     for date, date_emails in emails_by_date.items():
         # 날짜별 폴더 생성
         date_folder = os.path.join(gmail_path, date)
@@ -35,13 +42,17 @@ def save_emails_to_obsidian(emails):
         # 각 이메일을 별도 파일로 저장
         for idx, email in enumerate(date_emails, 1):
             file_path = os.path.join(date_folder, f"{date}_{idx}.md")
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"# {email['subject']}\n\n")
-                f.write(f"- **보낸 사람**: {email['from']}\n")
-                f.write(f"- **시간**: {email['date'].strftime('%H:%M')}\n")
-                f.write("\n**내용**:\n")
-                f.write(f"{email['content']}\n")
+            notes.append((file_path, (
+                f"# {email['subject']}\n\n"
+                f"- **보낸 사람**: {email['from']}\n"
+                f"- **시간**: {email['date'].strftime('%H:%M')}\n"
+                "\n**내용**:\n"
+                f"{email['content']}\n"
+            )))
+    
+    # iCloud 볼트는 파일마다 대기 시간이 있으므로 여러 파일을 동시에 저장
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        list(executor.map(lambda note: write_note(*note), notes))
 
 def get_megastudy_emails():
     mail = imaplib.IMAP4_SSL("imap.gmail.com")
@@ -59,10 +70,15 @@ def get_megastudy_emails():
 
     emails = []
 
-    # 각 이메일 처리
-    for num in message_numbers[0].split():
-        _, msg_data = mail.fetch(num, '(RFC822)')
-        email_body = msg_data[0][1]
+    # 검색된 이메일을 한 번의 요청으로 모두 가져오기
+    nums = message_numbers[0].split()
+    msg_data = mail.fetch(b",".join(nums), '(RFC822)')[1] if nums else []
+
+    # 각 이메일 처리 (응답에는 (헤더, 본문) 튜플 사이에 b')' 구분자가 섞여 있음)
+    for response_part in msg_data:
+        if not isinstance(response_part, tuple):
+            continue
+        email_body = response_part[1]
         email_message = email.message_from_bytes(email_body)
         
         # 이메일 정보 추출
@@ -9,6 +9,7 @@ import os
 import datetime
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from jira import JIRA
 from dotenv import load_dotenv
 
@@ -31,6 +32,9 @@ LAST_CHECK_FILE = os.path.join(OBSIDIAN_VAULT_PATH, ".jira_last_check")
 # 예: ["PROJ1", "PROJ2", "DEV"]
 PROJECT_KEYS = []
 
+# 댓글을 동시에 가져올 최대 요청 수 (Jira 요청 제한을 고려해 작게 유지)
+COMMENT_FETCH_WORKERS = 16
+
 def main():
     """메인 실행 함수"""
     # Jira 연결
@@ -54,20 +58,41 @@ def main():
     # 날짜별 알림 정리
     daily_notifications = defaultdict(lambda: defaultdict(list))
     
+    # 알림 타입별 (타입, 이슈) 목록
+    entries = [
+        (notification_type, issue)
+        for notification_type, issues in notifications.items()
+        for issue in issues
+    ]
+    
+    # 댓글 필터링 기준 시간은 한 번만 파싱
+    last_check_dt = utils.parse_check_time(last_check_time)
+    
+    # 여러 알림 타입에 걸친 이슈도 댓글은 한 번만 조회
+    unique_issues = list({issue.key: issue for _, issue in entries}.values())
+    
+    # 최근 댓글 확인 (검색 결과에 댓글이 없는 이슈만 HTTP 요청이 발생하므로 동시에 처리)
+    with ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS) as executor:
+        comments_cache = dict(zip(
+            (issue.key for issue in unique_issues),
+            executor.map(
+                lambda issue: utils.get_issue_comments(jira, issue, last_check_dt),
+                unique_issues
+            )
+        ))
+    
     # 알림 타입별 처리
-    for notification_type, issues in notifications.items():
-        for issue in issues:
-            # 업데이트 날짜 추출
-            update_date = datetime.datetime.strptime(
-                issue.fields.updated.split('.')[0], 
-                "%Y-%m-%dT%H:%M:%S"
-            ).date()
-            
-            # 최근 댓글 확인
-            comments = utils.get_issue_comments(jira, issue.key, last_check_time)
-            
-            # 날짜별로 알림 정리
-            daily_notifications[update_date][notification_type].append((issue, comments))
+    for notification_type, issue in entries:
+        comments = comments_cache[issue.key]
+        
+        # 업데이트 날짜 추출
+        update_date = utils.parse_jira_dt(issue.fields.updated).date()
+        
+        # 날짜별로 알림 정리
+        daily_notifications[update_date][notification_type].append((issue, comments))
+    
+    # 이번 실행에서 이미 만든 폴더 (같은 폴더에 makedirs를 반복하지 않도록)
+    created_dirs = set()
     
     # 날짜별 노트 생성
     for date, notifications_by_type in daily_notifications.items():
@@ -76,7 +101,8 @@ def main():
             date,
             notifications_by_type,
             OBSIDIAN_VAULT_PATH,
-            JIRA_BASE_FOLDER
+            JIRA_BASE_FOLDER,
+            created_dirs
         )
         print(f"생성됨: {daily_note_path}")
     
@@ -86,7 +112,8 @@ def main():
         week_start_date,
         daily_notifications,
         OBSIDIAN_VAULT_PATH,
-        JIRA_BASE_FOLDER
+        JIRA_BASE_FOLDER,
+        created_dirs
     )
     print(f"생성됨: {weekly_note_path}")
     
@@ -96,12 +123,13 @@ def main():
         month_date,
         daily_notifications,
         OBSIDIAN_VAULT_PATH,
-        JIRA_BASE_FOLDER
+        JIRA_BASE_FOLDER,
+        created_dirs
     )
     print(f"생성됨: {monthly_note_path}")
     
     # 인덱스 페이지 생성
-    index_path = utils.create_notification_index(OBSIDIAN_VAULT_PATH, JIRA_BASE_FOLDER)
+    index_path = utils.create_notification_index(OBSIDIAN_VAULT_PATH, JIRA_BASE_FOLDER, created_dirs)
     print(f"생성됨: {index_path}")
     
     # 마지막 확인 시간 업데이트
@@ -7,11 +7,63 @@ Jira 알림을 Obsidian에 동기화하는 유틸리티 모듈
 
 import os
 import datetime
-from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from jira import JIRA
 import json
 
+# search_issues 한 번에 가져올 최대 이슈 수
+SEARCH_PAGE_SIZE = 500
+
+# 노트 생성에 실제로 사용하는 필드만 요청
+ISSUE_FIELDS = "summary,status,issuetype,project,priority,assignee,reporter,created,updated,duedate,description,comment"
+
+# 알림 카테고리별 JQL 조건 (최근 업데이트 기간과 프로젝트 필터는 공통으로 붙음)
+NOTIFICATION_CONDITIONS = {
+    'assigned': 'assignee = currentUser()',                     # 나에게 할당된 이슈
+    'mentioned': 'comment ~ currentUser()',                     # 댓글에서 멘션된 이슈
+    'commented': 'issueFunction in commented("by currentUser()")',  # 내가 댓글을 단 이슈
+    'created': 'reporter = currentUser()',                      # 내가 생성한 이슈
+    'watching': 'watcher = currentUser()',                      # 내가 지켜보는 이슈
+}
+
+# 내가 담당자인 진행 중인 이슈 (기간 제한 없음)
+IN_PROGRESS_CONDITION = 'assignee = currentUser() AND status = "In Progress"'
+
+# 알림 요약에 표시할 알림 유형별 메시지
+NOTIFICATION_MESSAGES = {
+    'assigned': "🔔 **이슈가 나에게 할당되었습니다.**",
+    'mentioned': "💬 **댓글에서 내가 멘션되었습니다.**",
+    'commented': "📝 **내가 댓글을 단 이슈가 업데이트되었습니다.**",
+    'created': "✅ **내가 생성한 이슈가 업데이트되었습니다.**",
+    'watching': "👁️ **내가 지켜보는 이슈가 업데이트되었습니다.**",
+}
+
+# 파일명에 쓸 수 없는 문자를 '-'로 바꾸는 변환 테이블
+FILENAME_SANITIZE_TABLE = str.maketrans({'/': '-', '\\': '-', ':': '-'})
+
+# 노트 저장 시 사용할 쓰기 버퍼 크기
+NOTE_WRITE_BUFFER = 1 << 16
+
+def parse_jira_dt(value):
+    """Jira 날짜 문자열(예: 2024-01-02T03:04:05.000+0900)을 초 단위 datetime으로 변환"""
+    return datetime.datetime.fromisoformat(value[:19])
+
+def sanitize_summary(summary):
+    """이슈 제목 앞 30자를 파일명으로 쓸 수 있게 정리"""
+    return summary[:30].translate(FILENAME_SANITIZE_TABLE)
+
+def ensure_dir(path, created_dirs=None):
+    """폴더가 없으면 생성 (created_dirs에 이미 있는 경로는 이번 실행에서 건너뜀)
+    
+    created_dirs는 실행마다 새로 만드는 집합이라, 실행 사이에 폴더가 지워져도 다시 생성된다.
+    """
+    if created_dirs is not None and path in created_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    if created_dirs is not None:
+        created_dirs.add(path)
+
 def connect_to_jira(jira_server, jira_email, jira_api_token):
     """Jira에 연결"""
     try:
@@ -21,6 +73,10 @@ def connect_to_jira(jira_server, jira_email, jira_api_token):
         print(f"Jira 연결 실패: {e}")
         return None
 
+def parse_check_time(value):
+    """마지막 확인 시간 문자열(%Y-%m-%d %H:%M)을 datetime으로 변환"""
+    return datetime.datetime.fromisoformat(value.replace(' ', 'T'))
+
 def get_last_check_time(last_check_file):
     """마지막 확인 시간 가져오기"""
     if os.path.exists(last_check_file):
@@ -34,6 +90,20 @@ def save_last_check_time(last_check_file):
     with open(last_check_file, 'w') as f:
         f.write(datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
 
+def search_all_issues(jira, jql, fields=ISSUE_FIELDS):
+    """JQL 검색 결과를 모든 페이지에 걸쳐 가져오기"""
+    issues = []
+    start_at = 0
+    
+    while True:
+        page = jira.search_issues(jql, startAt=start_at, maxResults=SEARCH_PAGE_SIZE, fields=fields)
+        issues.extend(page)
+        start_at += len(page)
+        
+        # 마지막 페이지면 종료
+        if not page or start_at >= page.total:
+            return issues
+
 def get_my_notifications(jira, last_check_time, project_keys=None, days=7):
     """나와 관련된 이슈만 가져오기"""
     notifications = {
@@ -46,14 +116,9 @@ def get_my_notifications(jira, last_check_time, project_keys=None, days=7):
     }
     
     # 마지막 검색 시간 또는 지정된 일수 중 더 오래된 기준 사용
-    time_limit = last_check_time
+    # (둘 다 0으로 채운 "%Y-%m-%d %H:%M" 형식이라 문자열 비교로 충분)
     days_ago = (datetime.datetime.now() - datetime.timedelta(days=days)).strftime("%Y-%m-%d %H:%M")
-    
-    # 마지막 체크 시간이 지정된 일수보다 최근인 경우, 일수 기준 사용
-    last_check_date = datetime.datetime.strptime(last_check_time, "%Y-%m-%d %H:%M")
-    days_ago_date = datetime.datetime.strptime(days_ago, "%Y-%m-%d %H:%M")
-    if days_ago_date < last_check_date:
-        time_limit = days_ago
+    time_limit = min(last_check_time, days_ago)
     
     # 프로젝트 필터 적용
     project_filter = ""
@@ -61,69 +126,60 @@ def get_my_notifications(jira, last_check_time, project_keys=None, days=7):
         projects = ", ".join(f'"{key}"' for key in project_keys)
         project_filter = f" AND project in ({projects})"
     
-    try:
-        # 1. 나에게 할당된 이슈 (최근에 업데이트된 것)
-        assigned_jql = f'assignee = currentUser() AND updated >= "{time_limit}"{project_filter} ORDER BY updated DESC'
-        notifications['assigned'] = jira.search_issues(assigned_jql, maxResults=50)
-        
-        # 2. 댓글에서 멘션된 이슈
-        mentioned_jql = f'comment ~ currentUser() AND updated >= "{time_limit}"{project_filter} ORDER BY updated DESC'
-        notifications['mentioned'] = jira.search_issues(mentioned_jql, maxResults=50)
-        
-        # 3. 내가 댓글을 단 이슈
+    # 모든 카테고리에 공통으로 붙는 조건 (in_progress는 기간 제한 없음)
+    recent_suffix = f' AND updated >= "{time_limit}"{project_filter} ORDER BY updated DESC'
+    jqls = [(notification_type, f"{condition}{recent_suffix}")
+            for notification_type, condition in NOTIFICATION_CONDITIONS.items()]
+    jqls.append(('in_progress', f'{IN_PROGRESS_CONDITION}{project_filter} ORDER BY updated DESC'))
+    
+    def search(notification_type, jql):
         try:
-            commented_jql = f'issueFunction in commented("by currentUser()") AND updated >= "{time_limit}"{project_filter} ORDER BY updated DESC'
-            notifications['commented'] = jira.search_issues(commented_jql, maxResults=50)
-        except:
-            # issueFunction이 지원되지 않는 경우 빈 리스트 유지
-            print("댓글 함수 검색이 지원되지 않습니다. 수동으로 확인해 주세요.")
-        
-        # 4. 내가 생성한 이슈
-        created_jql = f'reporter = currentUser() AND updated >= "{time_limit}"{project_filter} ORDER BY updated DESC'
-        notifications['created'] = jira.search_issues(created_jql, maxResults=50)
-        
-        # 5. 내가 지켜보는 이슈
-        watching_jql = f'watcher = currentUser() AND updated >= "{time_limit}"{project_filter} ORDER BY updated DESC'
-        notifications['watching'] = jira.search_issues(watching_jql, maxResults=50)
-        
-        # 6. 내가 담당자인 진행 중인 이슈
-        in_progress_jql = f'assignee = currentUser() AND status = "In Progress"{project_filter} ORDER BY updated DESC'
-        notifications['in_progress'] = jira.search_issues(in_progress_jql, maxResults=50)
-        
-        return notifications
-    except Exception as e:
-        print(f"알림 검색 실패: {e}")
-        return notifications
+            return search_all_issues(jira, jql)
+        except Exception as e:
+            if notification_type == 'commented':
+                # issueFunction이 지원되지 않는 경우 빈 리스트 유지
+                print("댓글 함수 검색이 지원되지 않습니다. 수동으로 확인해 주세요.")
+            else:
+                print(f"알림 검색 실패 ({notification_type}): {e}")
+            return []
+    
+    # 카테고리별 검색은 서로 독립적이므로 동시에 요청
+    with ThreadPoolExecutor(max_workers=len(jqls)) as executor:
+        futures = {notification_type: executor.submit(search, notification_type, jql)
+                   for notification_type, jql in jqls}
+    
+    for notification_type, future in futures.items():
+        notifications[notification_type] = future.result()
+    
+    return notifications
 
-def get_issue_comments(jira, issue_key, last_check_time=None):
-    """이슈의 모든 댓글 가져오기 (last_check_time이 None이면 모든 댓글, 아니면 최근 댓글만)"""
+def get_issue_comments(jira, issue, last_check_dt=None):
+    """이슈의 모든 댓글 가져오기 (last_check_dt가 None이면 모든 댓글, 아니면 그 이후 댓글만)
+    
+    검색 결과에 comment 필드가 포함되어 있으면 그대로 사용하고, 없을 때만 이슈를 다시 조회한다.
+    """
     try:
-        issue = jira.issue(issue_key)
-        all_comments = []
+        comment_field = getattr(issue.fields, 'comment', None)
+        if comment_field is None:
+            comment_field = jira.issue(issue.key, fields='comment').fields.comment
         
-        for comment in issue.fields.comment.comments:
-            comment_date = datetime.datetime.strptime(
-                comment.created.split('.')[0], 
-                "%Y-%m-%dT%H:%M:%S"
-            )
-            
-            # last_check_time이 None이거나, 최근 댓글이면 추가
-            if last_check_time is None or (
-                last_check_time and comment_date > datetime.datetime.strptime(
-                    last_check_time, "%Y-%m-%d %H:%M"
-                )
-            ):
-                all_comments.append({
-                    'author': comment.author.displayName,
-                    'body': comment.body,
-                    'created': comment.created.split('T')[0] + ' ' + comment.created.split('T')[1].split('.')[0],
-                    'created_date': comment_date
-                })
+        dated_comments = ((parse_jira_dt(comment.created), comment) for comment in comment_field.comments)
+        all_comments = [
+            {
+                'author': comment.author.displayName,
+                'body': comment.body,
+                'created': comment_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'created_date': comment_date
+            }
+            for comment_date, comment in dated_comments
+            # last_check_dt가 None이거나, 최근 댓글이면 추가
+            if last_check_dt is None or comment_date > last_check_dt
+        ]
         
         # 날짜순으로 정렬 (오래된 것부터)
         return sorted(all_comments, key=lambda x: x['created_date'])
     except Exception as e:
-        print(f"댓글 가져오기 실패 ({issue_key}): {e}")
+        print(f"댓글 가져오기 실패 ({issue.key}): {e}")
         return []
 
 def issue_to_markdown(issue, comments=None, jira_server=""):
@@ -131,56 +187,55 @@ def issue_to_markdown(issue, comments=None, jira_server=""):
     fields = issue.fields
     
     # 기본 정보
-    markdown = f"# [{issue.key}] {fields.summary}\n\n"
-    markdown += f"**Status**: {fields.status.name}  \n"
-    markdown += f"**Type**: {fields.issuetype.name}  \n"
-    markdown += f"**Project**: {fields.project.name} ({fields.project.key})  \n"
+    parts = [
+        f"# [{issue.key}] {fields.summary}\n\n",
+        f"**Status**: {fields.status.name}  \n",
+        f"**Type**: {fields.issuetype.name}  \n",
+        f"**Project**: {fields.project.name} ({fields.project.key})  \n",
+    ]
     
-    if hasattr(fields, 'priority') and fields.priority:
-        markdown += f"**Priority**: {fields.priority.name}  \n"
+    if priority := getattr(fields, 'priority', None):
+        parts.append(f"**Priority**: {priority.name}  \n")
     
-    if hasattr(fields, 'assignee') and fields.assignee:
-        markdown += f"**Assignee**: {fields.assignee.displayName}  \n"
+    if assignee := getattr(fields, 'assignee', None):
+        parts.append(f"**Assignee**: {assignee.displayName}  \n")
     
-    if hasattr(fields, 'reporter') and fields.reporter:
-        markdown += f"**Reporter**: {fields.reporter.displayName}  \n"
+    if reporter := getattr(fields, 'reporter', None):
+        parts.append(f"**Reporter**: {reporter.displayName}  \n")
     
-    markdown += f"**Created**: {fields.created.split('T')[0]}  \n"
-    markdown += f"**Updated**: {fields.updated.split('T')[0]}  \n\n"
+    parts.append(f"**Created**: {fields.created.split('T')[0]}  \n")
+    parts.append(f"**Updated**: {fields.updated.split('T')[0]}  \n\n")
     
     # 설명
     if fields.description:
-        markdown += f"## Description\n\n{fields.description}\n\n"
+        parts.append(f"## Description\n\n{fields.description}\n\n")
     
     # 모든 댓글 (전체 내용)
-    if comments and len(comments) > 0:
-        markdown += f"## Comments ({len(comments)})\n\n"
-        for comment in comments:
-            markdown += f"### {comment['author']} - {comment['created']}\n\n"
-            markdown += f"{comment['body']}\n\n"
+    if comments:
+        parts.append(f"## Comments ({len(comments)})\n\n")
+        parts.extend(
+            f"### {comment['author']} - {comment['created']}\n\n{comment['body']}\n\n"
+            for comment in comments
+        )
     
     # Jira 링크
-    markdown += f"---\n[View in Jira]({jira_server}/browse/{issue.key})"
+    parts.append(f"---\n[View in Jira]({jira_server}/browse/{issue.key})")
     
-    return markdown
+    return "".join(parts)
 
-def save_to_obsidian(issue, markdown_content, obsidian_vault_path, jira_base_folder):
+def save_to_obsidian(issue, markdown_content, obsidian_vault_path, jira_base_folder, created_dirs=None):
     """Markdown 콘텐츠를 Obsidian 볼트에 저장 (프로젝트별 폴더 구조)"""
     # 프로젝트 키로 폴더 생성
     project_key = issue.fields.project.key
     project_path = os.path.join(obsidian_vault_path, jira_base_folder, project_key)
-    Path(project_path).mkdir(parents=True, exist_ok=True)
+    ensure_dir(project_path, created_dirs)
     
     # 파일명 생성 (이슈 키 + 제목의 일부)
-    sanitized_summary = issue.fields.summary[:30].replace('/', '-').replace('\\', '-').replace(':', '-')
-    file_name = f"{issue.key} - {sanitized_summary}.md"
+    file_name = f"{issue.key} - {sanitize_summary(issue.fields.summary)}.md"
     file_path = os.path.join(project_path, file_name)
     
     # 메타데이터 추가 (Obsidian 프론트매터)
-    update_date = datetime.datetime.strptime(
-        issue.fields.updated.split('.')[0], 
-        "%Y-%m-%dT%H:%M:%S"
-    )
+    update_date = parse_jira_dt(issue.fields.updated)
     
     front_matter = f"""---
 jira_key: {issue.key}
@@ -197,211 +252,212 @@ tags: [jira, {project_key.lower()}]
 """
     
     # 파일 저장
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(front_matter + markdown_content)
+    write_note(file_path, (front_matter, markdown_content))
     
     return file_path
 
 def create_notification_summary(issue, notification_type, comments=None, 
-                               jira_server="", obsidian_vault_path="", jira_base_folder=""):
-    """알림 요약 생성"""
+                               jira_server="", obsidian_vault_path="", jira_base_folder="",
+                               update_time=None):
+    """알림 요약 생성 (update_time: 이미 파싱한 업데이트 시간이 있으면 재사용)"""
     fields = issue.fields
     
-    # 기본 정보
-    summary = f"## [{issue.key}] {fields.summary}\n\n"
-    
-    # 알림 유형에 따른 메시지
-    type_msg = ""
-    if notification_type == "assigned":
-        type_msg = "🔔 **이슈가 나에게 할당되었습니다.**"
-    elif notification_type == "mentioned":
-        type_msg = "💬 **댓글에서 내가 멘션되었습니다.**"
-    elif notification_type == "commented":
-        type_msg = "📝 **내가 댓글을 단 이슈가 업데이트되었습니다.**"
-    elif notification_type == "created":
-        type_msg = "✅ **내가 생성한 이슈가 업데이트되었습니다.**"
-    elif notification_type == "watching":
-        type_msg = "👁️ **내가 지켜보는 이슈가 업데이트되었습니다.**"
-    
-    summary += f"{type_msg}\n\n"
-    
-    # 주요 정보
-    summary += f"- **상태**: {fields.status.name}\n"
-    summary += f"- **프로젝트**: {fields.project.name} ({fields.project.key})\n"
+    # 기본 정보와 알림 유형에 따른 메시지
+    parts = [
+        f"## [{issue.key}] {fields.summary}\n\n",
+        f"{NOTIFICATION_MESSAGES.get(notification_type, '')}\n\n",
+        # 주요 정보
+        f"- **상태**: {fields.status.name}\n",
+        f"- **프로젝트**: {fields.project.name} ({fields.project.key})\n",
+    ]
     
     if hasattr(fields, 'assignee') and fields.assignee:
-        summary += f"- **담당자**: {fields.assignee.displayName}\n"
+        parts.append(f"- **담당자**: {fields.assignee.displayName}\n")
     
     # 업데이트 날짜/시간
-    update_time = datetime.datetime.strptime(
-        fields.updated.split('.')[0], 
-        "%Y-%m-%dT%H:%M:%S"
-    )
-    summary += f"- **업데이트**: {update_time.strftime('%Y-%m-%d %H:%M')}\n\n"
+    if update_time is None:
+        update_time = parse_jira_dt(fields.updated)
+    parts.append(f"- **업데이트**: {update_time.strftime('%Y-%m-%d %H:%M')}\n\n")
     
-    # 최근 댓글 요약 (있는 경우)
-    if comments and len(comments) > 0:
-        for comment in sorted(comments, key=lambda x: x['created_date'], reverse=True)[:1]:  # 최신 댓글 1개만
-            summary += f"**최근 댓글** ({comment['author']}):\n> {comment['body'][:150]}{'...' if len(comment['body']) > 150 else ''}\n\n"
+    # 최근 댓글 요약 (있는 경우, 최신 댓글 1개만)
+    if comments:
+        comment = max(comments, key=lambda x: x['created_date'])
+        parts.append(f"**최근 댓글** ({comment['author']}):\n> {comment['body'][:150]}{'...' if len(comment['body']) > 150 else ''}\n\n")
     
     # 링크 추가
-    summary_clean = fields.summary[:30].replace('/', '-').replace('\\', '-').replace(':', '-')
-    file_path = f"{jira_base_folder}/{fields.project.key}/{issue.key} - {summary_clean}"
-    summary += f"[이슈 상세 보기](obsidian://open?vault={os.path.basename(obsidian_vault_path)}&file={file_path})\n"
-    summary += f"[Jira에서 보기]({jira_server}/browse/{issue.key})\n\n"
+    file_path = f"{jira_base_folder}/{fields.project.key}/{issue.key} - {sanitize_summary(fields.summary)}"
+    parts.append(f"[이슈 상세 보기](obsidian://open?vault={os.path.basename(obsidian_vault_path)}&file={file_path})\n")
+    parts.append(f"[Jira에서 보기]({jira_server}/browse/{issue.key})\n\n")
     
-    summary += "---\n\n"  # 구분선
+    parts.append("---\n\n")  # 구분선
     
-    return summary
+    return "".join(parts)
 
-def create_daily_note(date, daily_notifications, vault_path, jira_base_folder):
+def write_note(note_path, parts):
+    """노트 조각들을 하나로 합쳐 한 번에 저장
+    
+    임시 파일에 먼저 쓴 뒤 교체하므로 Obsidian이 반쯤 쓰인 파일을 보지 않는다.
+    """
+    tmp_path = f"{note_path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=NOTE_WRITE_BUFFER) as f:
+            f.write("".join(parts))
+        os.replace(tmp_path, note_path)
+    except BaseException:
+        # 실패한 임시 파일이 볼트에 남아 Obsidian에 보이지 않도록 정리
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def create_daily_note(date, daily_notifications, vault_path, jira_base_folder, created_dirs=None):
     """일일 노트 생성"""
     # 날짜 폴더 생성
     date_folder = os.path.join(vault_path, jira_base_folder, date.strftime("%Y-%m-%d"))
-    os.makedirs(date_folder, exist_ok=True)
+    ensure_dir(date_folder, created_dirs)
     
     # 일일 노트 파일 경로
     note_path = os.path.join(date_folder, f"{date.strftime('%Y-%m-%d')}.md")
     
-    with open(note_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {date.strftime('%Y년 %m월 %d일')} Jira 알림\n\n")
-        
-        # 문자열인 경우 JSON으로 파싱
-        if isinstance(daily_notifications, str):
+    parts = [f"# {date.strftime('%Y년 %m월 %d일')} Jira 알림\n\n"]
+    
+    # 문자열인 경우 JSON으로 파싱
+    if isinstance(daily_notifications, str):
+        try:
+            daily_notifications = json.loads(daily_notifications)
+        except json.JSONDecodeError:
+            print("JSON 파싱 실패")
+            write_note(note_path, parts)
+            return note_path
+    
+    # 작업 내용 섹션 추가
+    parts.append("## 오늘의 작업\n\n"
+                 "### 완료한 작업\n"
+                 "- [ ] \n\n"
+                 "### 진행 중인 작업\n")
+    
+    # 진행 중인 작업 목록 추가
+    if 'in_progress' in daily_notifications and daily_notifications['in_progress']:
+        for issue, _ in daily_notifications['in_progress']:
+            due_date = issue.fields.duedate if hasattr(issue.fields, 'duedate') and issue.fields.duedate else "마감일 없음"
+            parts.append(f"- [ ] {issue.key}: {issue.fields.summary} (마감일: {due_date})\n")
+    else:
+        parts.append("- [ ] \n")
+    
+    parts.append("\n### 내일 할 작업\n"
+                 "- [ ] \n\n"
+                 "## Jira 알림\n\n")
+    
+    for notification in daily_notifications:
+        if isinstance(notification, str):
             try:
-                daily_notifications = json.loads(daily_notifications)
+                notification = json.loads(notification)
             except json.JSONDecodeError:
-                print("JSON 파싱 실패")
-                return note_path
-        
-        # 작업 내용 섹션 추가
-        f.write("## 오늘의 작업\n\n")
-        f.write("### 완료한 작업\n")
-        f.write("- [ ] \n\n")
-        f.write("### 진행 중인 작업\n")
+                continue
         
-        # 진행 중인 작업 목록 추가
-        if 'in_progress' in daily_notifications and daily_notifications['in_progress']:
-            for issue, _ in daily_notifications['in_progress']:
-                due_date = issue.fields.duedate if hasattr(issue.fields, 'duedate') and issue.fields.duedate else "마감일 없음"
-                f.write(f"- [ ] {issue.key}: {issue.fields.summary} (마감일: {due_date})\n")
-        else:
-            f.write("- [ ] \n")
+        parts.append(f"### {notification['issue']['key']}: {notification['issue']['fields']['summary']}\n\n")
+        parts.append(f"- 상태: {notification['issue']['fields']['status']['name']}\n")
+        parts.append(f"- 담당자: {notification['issue']['fields']['assignee']['displayName']}\n")
+        parts.append(f"- 우선순위: {notification['issue']['fields']['priority']['name']}\n")
+        parts.append(f"- 마감일: {notification['issue']['fields']['duedate']}\n\n")
         
-        f.write("\n### 내일 할 작업\n")
-        f.write("- [ ] \n\n")
+        if 'comment' in notification:
+            parts.append("#### 댓글\n")
+            parts.append(f"- 작성자: {notification['comment']['author']['displayName']}\n")
+            parts.append(f"- 내용: {notification['comment']['body']}\n\n")
         
-        f.write("## Jira 알림\n\n")
-        for notification in daily_notifications:
-            if isinstance(notification, str):
-                try:
-                    notification = json.loads(notification)
-                except json.JSONDecodeError:
-                    continue
-            
-            f.write(f"### {notification['issue']['key']}: {notification['issue']['fields']['summary']}\n\n")
-            f.write(f"- 상태: {notification['issue']['fields']['status']['name']}\n")
-            f.write(f"- 담당자: {notification['issue']['fields']['assignee']['displayName']}\n")
-            f.write(f"- 우선순위: {notification['issue']['fields']['priority']['name']}\n")
-            f.write(f"- 마감일: {notification['issue']['fields']['duedate']}\n\n")
-            
-            if 'comment' in notification:
-                f.write("#### 댓글\n")
-                f.write(f"- 작성자: {notification['comment']['author']['displayName']}\n")
-                f.write(f"- 내용: {notification['comment']['body']}\n\n")
-            
-            f.write("---\n\n")
+        parts.append("---\n\n")
     
+    write_note(note_path, parts)
     return note_path
 
-def create_weekly_note(start_date, daily_notifications, vault_path, jira_base_folder):
+def create_weekly_note(start_date, daily_notifications, vault_path, jira_base_folder, created_dirs=None):
     """주간 노트 생성"""
     # 주간 노트는 해당 주의 월요일 폴더에 저장
     date_folder = os.path.join(vault_path, jira_base_folder, start_date.strftime('%Y-%m-%d'))
-    os.makedirs(date_folder, exist_ok=True)
+    ensure_dir(date_folder, created_dirs)
     
     end_date = start_date + datetime.timedelta(days=6)
     note_path = os.path.join(date_folder, f"{start_date.strftime('%Y-%m-%d')}_weekly.md")
     
-    with open(note_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {start_date.strftime('%Y년 %m월 %d일')} ~ {end_date.strftime('%Y년 %m월 %d일')} 주간 Jira 알림\n\n")
-        
-        for date in sorted(daily_notifications.keys()):
-            if start_date <= date <= end_date:
-                f.write(f"## {date.strftime('%Y년 %m월 %d일')}\n\n")
-                for notification_type, issues in daily_notifications[date].items():
-                    if issues:
-                        f.write(f"### {notification_type}\n\n")
-                        for issue, _ in issues:
-                            f.write(f"- {issue.key}: {issue.fields.summary}\n")
-                        f.write("\n")
+    parts = [f"# {start_date.strftime('%Y년 %m월 %d일')} ~ {end_date.strftime('%Y년 %m월 %d일')} 주간 Jira 알림\n\n"]
     
+    for date in sorted(daily_notifications.keys()):
+        if start_date <= date <= end_date:
+            parts.append(f"## {date.strftime('%Y년 %m월 %d일')}\n\n")
+            for notification_type, issues in daily_notifications[date].items():
+                if issues:
+                    parts.append(f"### {notification_type}\n\n")
+                    parts.extend(f"- {issue.key}: {issue.fields.summary}\n" for issue, _ in issues)
+                    parts.append("\n")
+    
+    write_note(note_path, parts)
     return note_path
 
-def create_monthly_note(month_date, daily_notifications, vault_path, jira_base_folder):
+def create_monthly_note(month_date, daily_notifications, vault_path, jira_base_folder, created_dirs=None):
     """월간 노트 생성"""
     # 월간 노트는 해당 월의 첫 날 폴더에 저장
     date_folder = os.path.join(vault_path, jira_base_folder, month_date.strftime('%Y-%m-%d'))
-    os.makedirs(date_folder, exist_ok=True)
+    ensure_dir(date_folder, created_dirs)
     
     note_path = os.path.join(date_folder, f"{month_date.strftime('%Y-%m')}_monthly.md")
     
-    with open(note_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {month_date.strftime('%Y년 %m월')} Jira 알림\n\n")
-        
-        for date in sorted(daily_notifications.keys()):
-            if date.year == month_date.year and date.month == month_date.month:
-                f.write(f"## {date.strftime('%Y년 %m월 %d일')}\n\n")
-                for notification_type, issues in daily_notifications[date].items():
-                    if issues:
-                        f.write(f"### {notification_type}\n\n")
-                        for issue, _ in issues:
-                            f.write(f"- {issue.key}: {issue.fields.summary}\n")
-                        f.write("\n")
+    parts = [f"# {month_date.strftime('%Y년 %m월')} Jira 알림\n\n"]
+    
+    for date in sorted(daily_notifications.keys()):
+        if date.year == month_date.year and date.month == month_date.month:
+            parts.append(f"## {date.strftime('%Y년 %m월 %d일')}\n\n")
+            for notification_type, issues in daily_notifications[date].items():
+                if issues:
+                    parts.append(f"### {notification_type}\n\n")
+                    parts.extend(f"- {issue.key}: {issue.fields.summary}\n" for issue, _ in issues)
+                    parts.append("\n")
     
+    write_note(note_path, parts)
     return note_path
 
-def create_notification_index(vault_path, jira_base_folder):
+def create_notification_index(vault_path, jira_base_folder, created_dirs=None):
     """알림 인덱스 페이지 생성"""
     index_folder = os.path.join(vault_path, jira_base_folder)
-    os.makedirs(index_folder, exist_ok=True)
+    ensure_dir(index_folder, created_dirs)
     
     index_path = os.path.join(index_folder, "index.md")
     
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write("# Jira 알림 인덱스\n\n")
-        f.write("## 월별 알림\n\n")
-        
-        # 월별 노트 링크 생성
-        current_date = datetime.date.today()
-        for i in range(12):
-            month_date = current_date.replace(day=1) - datetime.timedelta(days=30*i)
-            f.write(f"- [[{month_date.strftime('%Y-%m-%d')}/{month_date.strftime('%Y-%m')}_monthly|{month_date.strftime('%Y년 %m월')}]]\n")
-        
-        f.write("\n## 주간 알림\n\n")
-        
-        # 주간 노트 링크 생성
-        for i in range(4):
-            week_start = current_date - datetime.timedelta(days=7*i)
-            f.write(f"- [[{week_start.strftime('%Y-%m-%d')}/{week_start.strftime('%Y-%m-%d')}_weekly|{week_start.strftime('%Y년 %m월 %d일')} 주간]]\n")
-        
-        f.write("\n## 일별 알림\n\n")
-        
-        # 일별 노트 링크 생성
-        for i in range(7):
-            day = current_date - datetime.timedelta(days=i)
-            f.write(f"- [[{day.strftime('%Y-%m-%d')}/{day.strftime('%Y-%m-%d')}|{day.strftime('%Y년 %m월 %d일')}]]\n")
+    parts = ["# Jira 알림 인덱스\n\n", "## 월별 알림\n\n"]
+    
+    # 월별 노트 링크 생성
+    current_date = datetime.date.today()
+    # 월간 노트는 매월 1일 폴더에 있으므로 달력 기준으로 한 달씩 거슬러 올라감
+    year, month = current_date.year, current_date.month
+    for _ in range(12):
+        parts.append(f"- [[{year}-{month:02d}-01/{year}-{month:02d}_monthly|{year}년 {month:02d}월]]\n")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
     
+    parts.append("\n## 주간 알림\n\n")
+    
+    # 주간 노트 링크 생성
+    for i in range(4):
+        week_start = current_date - datetime.timedelta(days=7*i)
+        folder = week_start.isoformat()
+        parts.append(f"- [[{folder}/{folder}_weekly|{week_start.year}년 {week_start.month:02d}월 {week_start.day:02d}일 주간]]\n")
+    
+    parts.append("\n## 일별 알림\n\n")
+    
+    # 일별 노트 링크 생성
+    for i in range(7):
+        day = current_date - datetime.timedelta(days=i)
+        folder = day.isoformat()
+        parts.append(f"- [[{folder}/{folder}|{day.year}년 {day.month:02d}월 {day.day:02d}일]]\n")
+    
+    write_note(index_path, parts)
     return index_path
 
 def remove_duplicates(issues_list):
-    """중복 이슈 제거"""
-    seen = set()
-    unique_issues = []
-    
+    """중복 이슈 제거 (처음 나온 순서와 이슈를 유지)"""
+    unique_issues = {}
     for issue in issues_list:
-        if issue.key not in seen:
-            seen.add(issue.key)
-            unique_issues.append(issue)
-    
-    return unique_issues
\ No newline at end of file
+        unique_issues.setdefault(issue.key, issue)
+    return list(unique_issues.values())
\ No newline at end of file
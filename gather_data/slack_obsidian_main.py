@@ -6,12 +6,15 @@
 """
 
 import os
-import time
 import datetime
+import json
 from pathlib import Path
 from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import slack_sdk
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 from dotenv import load_dotenv
 
 # .env 파일에서 환경 변수 로드
@@ -24,6 +27,27 @@ OBSIDIAN_VAULT_PATH = os.getenv("OBSIDIAN_VAULT_PATH")
 SLACK_BASE_FOLDER = os.getenv("SLACK_BASE_FOLDER", "Slack")  # 기본값 설정
 OLDEST_TIMESTAMP = os.getenv("OLDEST_TIMESTAMP")  # 2024년 4월 1일 타임스탬프 또는 그 이후
 
+# 사용자 ID별 사용자 정보 캐시 (메시지마다 users.info를 다시 호출하지 않도록)
+USER_CACHE = {}
+
+# 페이지 단위 API(conversations.history/replies, users.list) 한 번에 가져올 최대 항목 수
+SLACK_PAGE_LIMIT = int(os.getenv("SLACK_PAGE_LIMIT", "200"))
+
+# 스레드 댓글을 동시에 가져올 최대 요청 수 (conversations.replies 속도 제한을 고려해 작게 유지)
+REPLY_FETCH_WORKERS = 4
+
+# 속도 제한(429) 응답 시 최대 재시도 횟수
+RATE_LIMIT_RETRIES = 5
+
+# 노트 저장 시 사용할 쓰기 버퍼 크기
+WRITE_BUFFER = 1 << 16
+
+# 채널별 증분 동기화 상태를 저장할 파일명
+SYNC_STATE_FILE = ".sync_state.json"
+
+# 체크포인트 이전 메시지의 새 댓글을 확인할 기간 (일, 이 기간의 채널 기록을 매번 다시 읽음)
+SLACK_THREAD_WATCH_DAYS = int(os.getenv("SLACK_THREAD_WATCH_DAYS", "30"))
+
 def initialize_slack_client():
     """슬랙 클라이언트 초기화"""
     if not SLACK_TOKEN:
@@ -31,6 +55,8 @@ def initialize_slack_client():
         return None
     
     client = slack_sdk.WebClient(token=SLACK_TOKEN)
+    # 429 응답은 Retry-After 만큼 기다린 뒤 자동으로 재시도
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=RATE_LIMIT_RETRIES))
     try:
         # 연결 테스트
         client.auth_test()
@@ -57,21 +83,30 @@ def timestamp_to_date(ts):
     """슬랙 타임스탬프를 datetime 객체로 변환"""
     return datetime.datetime.fromtimestamp(float(ts))
 
+@lru_cache(maxsize=4096)
+def format_timestamp(ts):
+    """슬랙 타임스탬프를 (날짜, 날짜+시간) 문자열로 변환 (같은 메시지는 한 번만 계산)"""
+    ts_date = timestamp_to_date(ts)
+    return ts_date.strftime("%Y-%m-%d"), ts_date.strftime("%Y-%m-%d %H:%M:%S")
+
 def get_channel_messages(client, channel_id, oldest=None):
-    """채널의 메시지 가져오기"""
+    """채널의 메시지 가져오기 (메시지 목록과 모든 페이지를 끝까지 가져왔는지 여부 반환)"""
     messages = []
     cursor = None
+    complete = False
     
     while True:
         try:
             # 요청 파라미터 구성
             params = {
                 "channel": channel_id,
-                "limit": 100  # 한 번에 가져올 최대 메시지 수
+                "limit": SLACK_PAGE_LIMIT
             }
             
             if oldest:
                 params["oldest"] = oldest
+                # oldest와 정확히 같은 시각의 메시지도 포함 (기본값은 제외)
+                params["inclusive"] = True
                 
             if cursor:
                 params["cursor"] = cursor
@@ -84,21 +119,20 @@ def get_channel_messages(client, channel_id, oldest=None):
             if response["has_more"]:
                 cursor = response["response_metadata"]["next_cursor"]
             else:
+                complete = True
                 break
             
-            # API 속도 제한 방지
-            time.sleep(1)
-            
         except SlackApiError as e:
             print(f"메시지 조회 오류: {e}")
             break
     
-    return messages
+    return messages, complete
 
 def get_message_replies(client, channel_id, thread_ts):
-    """메시지 스레드의 댓글 가져오기"""
+    """메시지 스레드의 댓글 가져오기 (댓글 목록과 모든 페이지를 끝까지 가져왔는지 여부 반환)"""
     replies = []
     cursor = None
+    complete = False
     
     while True:
         try:
@@ -106,7 +140,7 @@ def get_message_replies(client, channel_id, thread_ts):
             params = {
                 "channel": channel_id,
                 "ts": thread_ts,
-                "limit": 100  # 한 번에 가져올 최대 댓글 수
+                "limit": SLACK_PAGE_LIMIT
             }
             
             if cursor:
@@ -125,36 +159,78 @@ def get_message_replies(client, channel_id, thread_ts):
             if response["has_more"]:
                 cursor = response["response_metadata"]["next_cursor"]
             else:
+                complete = True
                 break
             
-            # API 속도 제한 방지
-            time.sleep(0.5)
-            
         except SlackApiError as e:
             print(f"댓글 조회 오류: {e}")
             break
     
-    return replies
+    return replies, complete
+
+def thread_state(message):
+    """다음 실행에서 새 댓글 여부를 비교할 스레드 요약 (conversations.history 응답에 포함된 값)"""
+    return {
+        "reply_count": message.get("reply_count", 0),
+        "latest_reply": message.get("latest_reply"),
+    }
+
+def to_user_info(user):
+    """슬랙 사용자 객체에서 필요한 정보만 추출"""
+    return {
+        "id": user["id"],
+        "name": user.get("real_name", user.get("name", "Unknown")),
+        "display_name": user.get("profile", {}).get("display_name", ""),
+        "image": user.get("profile", {}).get("image_72", "")
+    }
+
+def prefetch_all_users(client):
+    """users.list로 워크스페이스 사용자를 한 번에 가져와 캐시 채우기"""
+    USER_CACHE.clear()
+    cursor = None
+    
+    while True:
+        try:
+            params = {"limit": SLACK_PAGE_LIMIT}
+            if cursor:
+                params["cursor"] = cursor
+            
+            response = client.users_list(**params)
+            for user in response["members"]:
+                USER_CACHE[user["id"]] = to_user_info(user)
+            
+            # 다음 페이지가 있는지 확인
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        
+        except SlackApiError as e:
+            # 실패해도 get_user_info가 개별 조회로 대신 처리
+            print(f"사용자 목록 조회 오류: {e}")
+            break
+    
+    return USER_CACHE
 
 def get_user_info(client, user_id):
-    """사용자 ID로 사용자 정보 가져오기"""
+    """사용자 ID로 사용자 정보 가져오기 (캐시에 없는 사용자만 users.info로 조회)"""
+    if user_id in USER_CACHE:
+        return USER_CACHE[user_id]
+    
     try:
         response = client.users_info(user=user_id)
-        user = response["user"]
-        return {
-            "id": user_id,
-            "name": user.get("real_name", user.get("name", "Unknown")),
-            "display_name": user.get("profile", {}).get("display_name", ""),
-            "image": user.get("profile", {}).get("image_72", "")
-        }
+        user_info = to_user_info(response["user"])
     except SlackApiError as e:
         print(f"사용자 정보 조회 오류: {e}")
-        return {
+        # 실패한 사용자도 캐시해 같은 실행 중에 반복 요청하지 않음
+        user_info = {
             "id": user_id,
             "name": "Unknown User",
             "display_name": "",
             "image": ""
         }
+    
+    USER_CACHE[user_id] = user_info
+    return user_info
 
 def enrich_message_with_user_info(client, message):
     """메시지에 사용자 정보 추가"""
@@ -163,6 +239,15 @@ def enrich_message_with_user_info(client, message):
         message["user_info"] = user_info
     return message
 
+def format_files_to_markdown(files):
+    """첨부 파일 목록을 마크다운 줄 목록으로 변환"""
+    lines = [
+        f"**첨부 파일:** [{file.get('name', 'Unknown file')}]({file.get('url_private', '')})\n"
+        for file in files
+    ]
+    lines.append("\n")
+    return lines
+
 def format_message_to_markdown(message, channel_name):
     """메시지를 마크다운 형식으로 변환"""
     # 사용자 정보 가져오기
@@ -173,39 +258,33 @@ def format_message_to_markdown(message, channel_name):
     user_display = display_name if display_name else user_name
     
     # 타임스탬프를 날짜와 시간으로 변환
-    ts_date = timestamp_to_date(message["ts"])
-    formatted_date = ts_date.strftime("%Y-%m-%d %H:%M:%S")
+    formatted_date = format_timestamp(message["ts"])[1]
     
     # 메시지 텍스트 가져오기
     text = message.get("text", "")
     
     # 마크다운 형식으로 메시지 포맷팅
-    markdown = f"## {user_display} - {formatted_date}\n\n"
-    markdown += f"{text}\n\n"
+    parts = [f"## {user_display} - {formatted_date}\n\n{text}\n\n"]
     
     # 첨부 파일이 있는 경우
     if "files" in message:
-        for file in message["files"]:
-            file_name = file.get("name", "Unknown file")
-            file_url = file.get("url_private", "")
-            markdown += f"**첨부 파일:** [{file_name}]({file_url})\n"
-        markdown += "\n"
+        parts.extend(format_files_to_markdown(message["files"]))
     
     # 메시지 링크 추가
     message_link = f"https://{os.getenv('SLACK_WORKSPACE')}.slack.com/archives/{channel_name}/{message['ts'].replace('.', '')}"
-    markdown += f"[슬랙에서 보기]({message_link})\n\n"
+    parts.append(f"[슬랙에서 보기]({message_link})\n\n")
     
     # 구분선 추가
-    markdown += "---\n\n"
+    parts.append("---\n\n")
     
-    return markdown
+    return "".join(parts)
 
 def format_replies_to_markdown(replies):
     """댓글을 마크다운 형식으로 변환"""
     if not replies:
         return ""
     
-    markdown = "### 댓글\n\n"
+    parts = ["### 댓글\n\n"]
     
     for reply in replies:
         # 사용자 정보 가져오기
@@ -216,25 +295,37 @@ def format_replies_to_markdown(replies):
         user_display = display_name if display_name else user_name
         
         # 타임스탬프를 날짜와 시간으로 변환
-        ts_date = timestamp_to_date(reply["ts"])
-        formatted_date = ts_date.strftime("%Y-%m-%d %H:%M:%S")
+        formatted_date = format_timestamp(reply["ts"])[1]
         
         # 댓글 텍스트 가져오기
         text = reply.get("text", "")
         
         # 마크다운 형식으로 댓글 포맷팅
-        markdown += f"#### {user_display} - {formatted_date}\n\n"
-        markdown += f"{text}\n\n"
+        parts.append(f"#### {user_display} - {formatted_date}\n\n{text}\n\n")
         
         # 첨부 파일이 있는 경우
         if "files" in reply:
-            for file in reply["files"]:
-                file_name = file.get("name", "Unknown file")
-                file_url = file.get("url_private", "")
-                markdown += f"**첨부 파일:** [{file_name}]({file_url})\n"
-            markdown += "\n"
+            parts.extend(format_files_to_markdown(reply["files"]))
     
-    return markdown
+    return "".join(parts)
+
+def get_sync_state_path(obsidian_vault_path, slack_base_folder, channel_name):
+    """채널별 동기화 상태 파일 경로"""
+    return os.path.join(obsidian_vault_path, slack_base_folder, channel_name, SYNC_STATE_FILE)
+
+def load_sync_state(state_path):
+    """이전 동기화 상태 (다음 조회 시작 타임스탬프, 날짜별 메시지 수, 스레드별 댓글 상태) 불러오기"""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def save_sync_state(state_path, oldest, dates_count, threads):
+    """다음 실행에서 사용할 동기화 상태 저장"""
+    Path(os.path.dirname(state_path)).mkdir(parents=True, exist_ok=True)
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump({"oldest": oldest, "dates": dates_count, "threads": threads}, f, ensure_ascii=False)
 
 def save_to_obsidian(messages_by_date, channel_name, obsidian_vault_path, slack_base_folder):
     """날짜별로 메시지를 Obsidian에 저장"""
@@ -263,23 +354,15 @@ tags: [slack, {channel_name.lower()}, daily]
 
 """
         
-        # 본문 내용 생성
-        content = front_matter
-        
-        # 메시지 추가
-        for message_data in messages:
-            message = message_data["message"]
-            replies = message_data["replies"]
-            
-            # 메시지와 댓글을 마크다운으로 변환
-            message_markdown = format_message_to_markdown(message, channel_name)
-            replies_markdown = format_replies_to_markdown(replies)
+        # 파일 저장 (하루치 문서를 메모리에 모으지 않고 메시지 단위로 바로 기록)
+        with open(file_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as f:
+            f.write(front_matter)
             
-            content += message_markdown + replies_markdown
-        
-        # 파일 저장
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            # 메시지 추가
+            for message_data in messages:
+                # 메시지와 댓글을 마크다운으로 변환
+                f.write(format_message_to_markdown(message_data["message"], channel_name))
+                f.write(format_replies_to_markdown(message_data["replies"]))
         
         saved_files.append(file_path)
         print(f"저장됨: {file_path} (메시지 {len(messages)}개)")
@@ -316,18 +399,19 @@ tags: [slack, {channel_name.lower()}, index]
 """
     
     # 본문 내용 생성
-    content = front_matter
-    content += "## 날짜별 메시지\n\n"
+    content_parts = [front_matter, "## 날짜별 메시지\n\n"]
     
     # 최신 날짜순으로 정렬
     sorted_dates = sorted(dates, reverse=True)
     
-    for date_str in sorted_dates:
-        content += f"- [[{slack_base_folder}/{channel_name}/{date_str}/{date_str}|{date_str}]] - {dates[date_str]}개 메시지\n"
+    content_parts.extend(
+        f"- [[{slack_base_folder}/{channel_name}/{date_str}/{date_str}|{date_str}]] - {dates[date_str]}개 메시지\n"
+        for date_str in sorted_dates
+    )
     
     # 파일 저장
     with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+        f.write("".join(content_parts))
     
     print(f"인덱스 생성: {file_path}")
     return file_path
@@ -350,10 +434,52 @@ def main():
     if not channel_id:
         return
     
+    # 사용자 정보를 미리 한 번에 가져오기
+    prefetch_all_users(client)
+    
+    # 이전 실행의 동기화 상태가 있으면 그 이후 메시지만 가져오기
+    state_path = get_sync_state_path(OBSIDIAN_VAULT_PATH, SLACK_BASE_FOLDER, CHANNEL_NAME)
+    sync_state = load_sync_state(state_path)
+    checkpoint = sync_state.get("oldest")
+    threads = sync_state.get("threads", {})
+    
+    # 체크포인트 이전 메시지에 달린 새 댓글도 찾을 수 있도록 최근 SLACK_THREAD_WATCH_DAYS일은 항상 다시 읽기
+    # (스레드마다 conversations.replies를 부르지 않고, 원본 메시지의 reply_count/latest_reply로 변경 여부 판단)
+    fetch_oldest = checkpoint or OLDEST_TIMESTAMP
+    if checkpoint:
+        watch_start = datetime.datetime.combine(
+            datetime.date.today() - datetime.timedelta(days=SLACK_THREAD_WATCH_DAYS), datetime.time()
+        ).timestamp()
+        fetch_oldest = min(float(checkpoint), watch_start)
+        if OLDEST_TIMESTAMP:
+            fetch_oldest = max(fetch_oldest, float(OLDEST_TIMESTAMP))
+        fetch_oldest = str(fetch_oldest)
+    
     # 메시지 가져오기
-    messages = get_channel_messages(client, channel_id, OLDEST_TIMESTAMP)
+    messages, complete = get_channel_messages(client, channel_id, fetch_oldest)
     print(f"총 {len(messages)}개의 메시지를 가져왔습니다.")
     
+    # 체크포인트 이전 날짜는 댓글 상태가 바뀐 스레드가 있을 때만 다시 저장
+    # (처음 댓글이 달린 메시지도 이전 상태가 없으므로 포함, 날짜 파일은 통째로 덮어쓰므로
+    #  그날 메시지를 모두 받은 경우에만 다시 저장)
+    window_messages = messages
+    if checkpoint:
+        checkpoint_date = format_timestamp(checkpoint)[0]
+        changed_dates = set()
+        if complete:
+            changed_dates = {
+                format_timestamp(msg["ts"])[0]
+                for msg in window_messages
+                if msg.get("reply_count", 0) > 0 and threads.get(msg["ts"]) != thread_state(msg)
+            }
+        for date_str in sorted(changed_dates):
+            if date_str < checkpoint_date:
+                print(f"{date_str}: 새 댓글이 달린 스레드가 있어 다시 동기화합니다.")
+        messages = [
+            msg for msg in window_messages
+            if format_timestamp(msg["ts"])[0] >= checkpoint_date or format_timestamp(msg["ts"])[0] in changed_dates
+        ]
+    
     # 메시지 정보 강화
     enriched_messages = []
     for msg in messages:
@@ -364,18 +490,23 @@ def main():
     # 날짜별로 메시지 분류
     messages_by_date = defaultdict(list)
     
+    # 댓글이 있는 메시지의 스레드는 서로 독립적이므로 동시에 가져오기
+    threaded_messages = [msg for msg in enriched_messages if msg.get("reply_count", 0) > 0]
+    with ThreadPoolExecutor(max_workers=REPLY_FETCH_WORKERS) as executor:
+        replies_by_ts = dict(zip(
+            (msg["ts"] for msg in threaded_messages),
+            executor.map(lambda msg: get_message_replies(client, channel_id, msg["ts"]), threaded_messages)
+        ))
+    
     for message in enriched_messages:
         # 타임스탬프를 날짜로 변환
-        date = timestamp_to_date(message["ts"]).strftime("%Y-%m-%d")
+        date = format_timestamp(message["ts"])[0]
         
-        # 댓글이 있는 경우 댓글 가져오기
-        replies = []
-        if message.get("reply_count", 0) > 0:
-            raw_replies = get_message_replies(client, channel_id, message["ts"])
-            # 댓글에 사용자 정보 추가
-            for reply in raw_replies:
-                enriched_reply = enrich_message_with_user_info(client, reply)
-                replies.append(enriched_reply)
+        # 댓글에 사용자 정보 추가
+        replies = [
+            enrich_message_with_user_info(client, reply)
+            for reply in replies_by_ts.get(message["ts"], ([], True))[0]
+        ]
         
         # 날짜별로 메시지와 댓글 저장
         messages_by_date[date].append({
@@ -386,10 +517,32 @@ def main():
     # Obsidian에 저장
     saved_files = save_to_obsidian(messages_by_date, CHANNEL_NAME, OBSIDIAN_VAULT_PATH, SLACK_BASE_FOLDER)
     
-    # 인덱스 파일 생성
-    dates_count = {date: len(messages) for date, messages in messages_by_date.items()}
+    # 인덱스 파일 생성 (이전 실행에서 저장한 날짜도 함께 표시)
+    dates_count = dict(sync_state.get("dates", {}))
+    dates_count.update((date, len(messages)) for date, messages in messages_by_date.items())
     index_path = create_index_file(dates_count, CHANNEL_NAME, OBSIDIAN_VAULT_PATH, SLACK_BASE_FOLDER)
     
+    # 다시 읽은 기간의 스레드 댓글 상태를 기록해 다음 실행에서 비교
+    # (댓글을 끝까지 못 가져온 스레드는 기록하지 않아 다음 실행에서 다시 가져오게 함,
+    #  기간 밖으로 밀려난 스레드는 자연히 빠짐)
+    threads = {
+        msg["ts"]: thread_state(msg)
+        for msg in window_messages
+        if msg.get("reply_count", 0) > 0 and replies_by_ts.get(msg["ts"], ([], True))[1]
+    }
+    
+    # 다음 실행은 마지막으로 저장한 날짜의 0시부터 다시 가져오기
+    # (날짜 파일은 통째로 덮어쓰므로 그날 메시지를 모두 다시 받아야 함)
+    # 중간에 조회가 실패했다면 빠진 구간이 생기지 않도록 상태를 갱신하지 않음
+    if complete:
+        next_oldest = checkpoint
+        if messages_by_date:
+            # 다시 저장한 예전 날짜 때문에 체크포인트가 뒤로 가지 않도록 더 최근 값만 사용
+            last_date = datetime.datetime.strptime(max(messages_by_date), "%Y-%m-%d").timestamp()
+            if next_oldest is None or last_date > float(next_oldest):
+                next_oldest = str(last_date)
+        save_sync_state(state_path, next_oldest, dates_count, threads)
+    
     print(f"총 {len(saved_files)}개의 날짜 파일이 Obsidian에 동기화되었습니다.")
 
 if __name__ == "__main__":
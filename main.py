@@ -1,37 +1,49 @@
 import schedule
-import time
-import datetime
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 from gather_data.gmail_obsidian_main import get_megastudy_emails
 from gather_data.jira_obsidian_main import main as jira_obsidian_main
 from gather_data.slack_obsidian_main import main as slack_obsidian_main
-from client import run as client_run
+from client import SchedulerService
 
-async def run_all_tasks():
+# 서로 독립적인 동기화 작업 (모두 블로킹 네트워크 I/O)
+SYNC_TASKS = {
+    "GMAIL": get_megastudy_emails,
+    "JIRA": jira_obsidian_main,
+    "SLACK": slack_obsidian_main,
+}
+
+async def run_all_tasks(service):
     print(f"캘린더를 생성합니다!")
-    print(f"=== GMAIL 동기화 중 ... ===")
-    get_megastudy_emails()
-    print(f"=== JIRA 동기화 중 ... ===")
-    jira_obsidian_main()
-    print(f"=== SLACK 동기화 중 ... ===")
-    slack_obsidian_main()
+    print(f"=== {', '.join(SYNC_TASKS)} 동기화 중 ... ===")
+    # 이벤트 루프를 막지 않도록 각 작업을 스레드에서 동시에 실행
+    results = await asyncio.gather(
+        *(asyncio.to_thread(task) for task in SYNC_TASKS.values()),
+        return_exceptions=True,
+    )
+    for name, result in zip(SYNC_TASKS, results):
+        if isinstance(result, Exception):
+            print(f"{name} 동기화 실패: {result}")
     print(f"=== 클라이언트 동기화 중 ... ===")
-    await client_run()
+    await service.run_once()
 
-def schedule_job():
-    with ThreadPoolExecutor() as executor:
-        executor.submit(lambda: asyncio.run(run_all_tasks()))
+async def run_scheduler():
+    # iMCP 서버를 매번 다시 띄우지 않도록 하나의 서비스를 계속 사용
+    async with SchedulerService() as service:
+        running_tasks = set()
 
-if __name__ == "__main__":
-    # 매일 오전 7시에 실행
-    schedule.every().day.at("07:00").do(schedule_job)
-    
-    print("스케줄러가 실행 중입니다...")
-    while True:
-        schedule.run_pending()
-        time.sleep(1)  # 1분마다 체크
+        def schedule_job():
+            task = asyncio.create_task(run_all_tasks(service))
+            running_tasks.add(task)
+            task.add_done_callback(running_tasks.discard)
 
+        # 매일 오전 7시에 실행
+        schedule.every().day.at("07:00").do(schedule_job)
 
-    schedule_job()
+        print("스케줄러가 실행 중입니다...")
+        while True:
+            schedule.run_pending()
+            await asyncio.sleep(1)  # 1초마다 체크
+
+if __name__ == "__main__":
+    asyncio.run(run_scheduler())